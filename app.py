@@ -6,186 +6,213 @@ This Flask application provides a web interface for the ATS-optimized resume gen
 
 import os
 import json
+import time
+import shutil
 import tempfile
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for, flash, Response
+from functools import lru_cache
+from flask import Flask, render_template, request, send_from_directory, redirect, url_for, flash, session, Response
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 import resume_generator  # Import the resume generator module
 
+try:
+    import orjson  # Optional - much faster JSON encoding/decoding when installed
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress  # Optional - gzip/brotli compression of responses
+except ImportError:
+    Compress = None
+
 app = Flask(__name__)
-app.secret_key = os.urandom(24)  # For flash messages
+# For flash messages. Set SECRET_KEY when running several worker processes so they all
+# accept each other's session cookies; otherwise a random per-process key is used.
+app.secret_key = os.environ.get('SECRET_KEY') or os.urandom(24)
 app.config['UPLOAD_FOLDER'] = tempfile.gettempdir()
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload size
+app.config['MAX_JSON_UPLOAD_SIZE'] = 1 * 1024 * 1024  # 1MB max for resume JSON uploads
+app.config['OUTPUT_MAX_AGE'] = 60 * 60  # Seconds to keep each generated resume available for download
+
+# Each /generate call writes its files into a new directory in UPLOAD_FOLDER named with this prefix
+OUTPUT_DIR_PREFIX = 'ats_resume_'
+
+# Content types browsers send for .json files (octet-stream when the OS has no mapping)
+JSON_MIMETYPES = ('application/json', 'text/json', 'application/octet-stream')
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (used by the tojson filter, session cookie and JSON responses)"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+if orjson is not None:
+    app.json = OrjsonJSONProvider(app)
+
+# Compress JSON downloads and HTML pages when Flask-Compress is installed
+if Compress is not None:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+    app.config['COMPRESS_LEVEL'] = 6
+    Compress(app)
+
+def _encode_json(data):
+    """Encode data as indented JSON for a response body (orjson bytes, or stdlib encoder chunks)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.JSONEncoder(indent=2).iterencode(data)
+
+def _write_json(data, path):
+    """Write data to path as indented JSON"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+def _load_json(stream):
+    """Parse JSON from a binary file-like object"""
+    if orjson is not None:
+        return orjson.loads(stream.read())
+    return json.load(stream)
+
+# The plain form page (no prefill data, no flash messages) is static, so it is rendered once
+_index_html = None
 
 @app.route('/')
 def index():
     """Render the main form page"""
-    return render_template('index.html')
+    global _index_html
+    # Flash messages are per-request, and debug mode reloads templates, so render those normally
+    if '_flashes' in session or app.debug:
+        return render_template('index.html')
+    if _index_html is None:
+        _index_html = render_template('index.html')
+    return _index_html
+
+def _collect_list_field(get, counts, prefix, key):
+    """Collect the non-blank values of a numbered list field (e.g. work_0_resp_0..N)"""
+    item_prefix = f'{prefix}{key}_'
+    count = counts.get(f'{item_prefix}count', 0)
+    return [value for value in (
+        (get(f'{item_prefix}{j}') or '').strip() for j in range(count)
+    ) if value]
+
+def _split_comma_list(text):
+    """Split a comma-separated form value into a list of non-blank items"""
+    return [item.strip() for item in text.split(',') if item.strip()]
+
+# The entry builders below use dict literals on purpose: for these small fixed-shape records a
+# literal is faster than dict(zip(keys, values)) and needs no dataclass -> dict conversion later.
+def _extract_experience(get, counts, prefix):
+    """Extract one work experience or internship entry (they share the same fields)"""
+    return {
+        "title": get(f'{prefix}title'),
+        "company": get(f'{prefix}company'),
+        "location": get(f'{prefix}location'),
+        "start_date": get(f'{prefix}start_date'),
+        "end_date": get(f'{prefix}end_date'),
+        "responsibilities": _collect_list_field(get, counts, prefix, 'resp'),
+        "achievements": _collect_list_field(get, counts, prefix, 'ach')
+    }
+
+def _extract_project(get, prefix):
+    """Extract one project entry"""
+    return {
+        "name": get(f'{prefix}name'),
+        "description": get(f'{prefix}description'),
+        "technologies": _split_comma_list(get(f'{prefix}technologies', '')),
+        "url": get(f'{prefix}url') or None,
+        "start_date": get(f'{prefix}start_date') or None,
+        "end_date": get(f'{prefix}end_date') or None
+    }
+
+def _extract_certification(get, prefix):
+    """Extract one certification entry"""
+    return {
+        "name": get(f'{prefix}name'),
+        "issuer": get(f'{prefix}issuer'),
+        "date": get(f'{prefix}date'),
+        "expiration_date": get(f'{prefix}expiration') or None,
+        "url": get(f'{prefix}url') or None
+    }
+
+def _extract_education(get, prefix):
+    """Extract one education entry"""
+    courses = _split_comma_list(get(f'{prefix}courses', ''))
+    return {
+        "degree": get(f'{prefix}degree'),
+        "institution": get(f'{prefix}institution'),
+        "location": get(f'{prefix}location'),
+        "graduation_date": get(f'{prefix}graduation'),
+        "gpa": get(f'{prefix}gpa') or None,
+        "relevant_courses": courses if courses else None
+    }
 
 def extract_resume_data_from_form(form_data):
     """Extract and format resume data from form submission"""
+    # Snapshot the single-valued fields into a plain dict (first value per key) so every
+    # lookup below is a dict.get; the list-valued skill fields still use getlist further down
+    fields = form_data.to_dict()
+    get = fields.get  # Bound once; looked up for every field below
+    # Parse every hidden *_count field in a single pass
+    counts = {key: int(value) for key, value in fields.items() if key.endswith('_count')}
     data = {
-        "name": form_data.get('name'),
-        "contact_info": [
-            form_data.get('email'),
-            form_data.get('phone'),
-            form_data.get('linkedin'),
-            form_data.get('location')
-        ],
+        "name": get('name'),
+        # Always exactly these four entries; a tuple still serializes as a JSON array
+        "contact_info": (get('email'), get('phone'), get('linkedin'), get('location')),
         "work_experience": [],
         "technical_skills": {},
         "education": []
     }
     
     # Add professional summary only if it's not empty
-    professional_summary = form_data.get('professional_summary', '').strip()
+    professional_summary = get('professional_summary', '').strip()
     if professional_summary:
         data["professional_summary"] = professional_summary
     
     # Process work experience
-    work_count = int(form_data.get('work_count', 0))
-    for i in range(work_count):
-        prefix = f'work_{i}_'
-        
-        # Get responsibilities and achievements as arrays
-        responsibilities = []
-        achievements = []
-        
-        resp_count = int(form_data.get(f'{prefix}resp_count', 0))
-        for j in range(resp_count):
-            resp = form_data.get(f'{prefix}resp_{j}')
-            if resp and resp.strip():
-                responsibilities.append(resp.strip())
-        
-        ach_count = int(form_data.get(f'{prefix}ach_count', 0))
-        for j in range(ach_count):
-            ach = form_data.get(f'{prefix}ach_{j}')
-            if ach and ach.strip():
-                achievements.append(ach.strip())
-        
-        experience = {
-            "title": form_data.get(f'{prefix}title'),
-            "company": form_data.get(f'{prefix}company'),
-            "location": form_data.get(f'{prefix}location'),
-            "start_date": form_data.get(f'{prefix}start_date'),
-            "end_date": form_data.get(f'{prefix}end_date'),
-            "responsibilities": responsibilities,
-            "achievements": achievements
-        }
-        
-        data["work_experience"].append(experience)
+    data["work_experience"] = [
+        _extract_experience(get, counts, f'work_{i}_') for i in range(counts.get('work_count', 0))
+    ]
     
-    # Process internships (optional)
-    intern_count = int(form_data.get('intern_count', 0))
-    if intern_count > 0:
-        data["internships"] = []
-        
-        for i in range(intern_count):
-            prefix = f'intern_{i}_'
-            
-            # Get responsibilities and achievements as arrays
-            responsibilities = []
-            achievements = []
-            
-            resp_count = int(form_data.get(f'{prefix}resp_count', 0))
-            for j in range(resp_count):
-                resp = form_data.get(f'{prefix}resp_{j}')
-                if resp and resp.strip():
-                    responsibilities.append(resp.strip())
-            
-            ach_count = int(form_data.get(f'{prefix}ach_count', 0))
-            for j in range(ach_count):
-                ach = form_data.get(f'{prefix}ach_{j}')
-                if ach and ach.strip():
-                    achievements.append(ach.strip())
-            
-            internship = {
-                "title": form_data.get(f'{prefix}title'),
-                "company": form_data.get(f'{prefix}company'),
-                "location": form_data.get(f'{prefix}location'),
-                "start_date": form_data.get(f'{prefix}start_date'),
-                "end_date": form_data.get(f'{prefix}end_date'),
-                "responsibilities": responsibilities,
-                "achievements": achievements
-            }
-            
-            data["internships"].append(internship)
+    # Optional sections are only added when they have entries
+    intern_count = counts.get('intern_count', 0)
+    if intern_count:
+        data["internships"] = [_extract_experience(get, counts, f'intern_{i}_') for i in range(intern_count)]
     
-    # Process projects (optional)
-    project_count = int(form_data.get('project_count', 0))
-    if project_count > 0:
-        data["projects"] = []
-        
-        for i in range(project_count):
-            prefix = f'project_{i}_'
-            
-            # Get technologies as an array
-            technologies_text = form_data.get(f'{prefix}technologies', '')
-            technologies = [tech.strip() for tech in technologies_text.split(',') if tech.strip()]
-            
-            project = {
-                "name": form_data.get(f'{prefix}name'),
-                "description": form_data.get(f'{prefix}description'),
-                "technologies": technologies,
-                "url": form_data.get(f'{prefix}url') or None,
-                "start_date": form_data.get(f'{prefix}start_date') or None,
-                "end_date": form_data.get(f'{prefix}end_date') or None
-            }
-            
-            data["projects"].append(project)
+    project_count = counts.get('project_count', 0)
+    if project_count:
+        data["projects"] = [_extract_project(get, f'project_{i}_') for i in range(project_count)]
     
     # Process technical skills
     skill_categories = form_data.getlist('skill_category[]')
     skill_values = form_data.getlist('skill_values[]')
     
-    for i in range(len(skill_categories)):
-        if i < len(skill_values):
-            category = skill_categories[i].strip()
-            if category:
-                # Split comma-separated skills into a list
-                skills = [skill.strip() for skill in skill_values[i].split(',') if skill.strip()]
-                if skills:
-                    data["technical_skills"][category] = skills
+    # Pair each category with its comma-separated skills, dropping blank categories and empty skill lists
+    parsed_skills = (
+        (category.strip(), _split_comma_list(values))
+        for category, values in zip(skill_categories, skill_values)
+    )
+    data["technical_skills"] = {category: skills for category, skills in parsed_skills if category and skills}
     
-    # Process certifications (optional)
-    cert_count = int(form_data.get('cert_count', 0))
-    if cert_count > 0:
-        data["certifications"] = []
-        
-        for i in range(cert_count):
-            prefix = f'cert_{i}_'
-            
-            certification = {
-                "name": form_data.get(f'{prefix}name'),
-                "issuer": form_data.get(f'{prefix}issuer'),
-                "date": form_data.get(f'{prefix}date'),
-                "expiration_date": form_data.get(f'{prefix}expiration') or None,
-                "url": form_data.get(f'{prefix}url') or None
-            }
-            
-            data["certifications"].append(certification)
+    cert_count = counts.get('cert_count', 0)
+    if cert_count:
+        data["certifications"] = [_extract_certification(get, f'cert_{i}_') for i in range(cert_count)]
     
     # Process education
-    edu_count = int(form_data.get('edu_count', 0))
-    for i in range(edu_count):
-        prefix = f'edu_{i}_'
-        
-        # Get courses as an array
-        courses_text = form_data.get(f'{prefix}courses', '')
-        courses = [course.strip() for course in courses_text.split(',') if course.strip()]
-        
-        education = {
-            "degree": form_data.get(f'{prefix}degree'),
-            "institution": form_data.get(f'{prefix}institution'),
-            "location": form_data.get(f'{prefix}location'),
-            "graduation_date": form_data.get(f'{prefix}graduation'),
-            "gpa": form_data.get(f'{prefix}gpa') or None,
-            "relevant_courses": courses if courses else None
-        }
-        
-        data["education"].append(education)
+    data["education"] = [_extract_education(get, f'edu_{i}_') for i in range(counts.get('edu_count', 0))]
     
     # Set output filename (optional)
-    output_filename = form_data.get('output_filename')
+    output_filename = get('output_filename')
     if output_filename:
         if not output_filename.endswith('.docx'):
             output_filename += '.docx'
@@ -193,6 +220,24 @@ def extract_resume_data_from_form(form_data):
     
     return data
 
+def _clean_name(data):
+    """File-name-safe form of the person's name, used to name downloads"""
+    return secure_filename(data.get('name') or '') or 'resume'
+
+def _remove_expired_outputs():
+    """Delete per-request output directories older than OUTPUT_MAX_AGE"""
+    cutoff = time.time() - app.config['OUTPUT_MAX_AGE']
+    with os.scandir(app.config['UPLOAD_FOLDER']) as entries:
+        for entry in entries:
+            if not entry.name.startswith(OUTPUT_DIR_PREFIX):
+                continue
+            try:
+                expired = entry.is_dir() and entry.stat().st_mtime < cutoff
+            except OSError:
+                continue  # Already removed, e.g. by another worker's sweep
+            if expired:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
 @app.route('/save_json', methods=['POST'])
 def save_json():
     """Save form data as JSON and return as downloadable file"""
@@ -200,12 +245,11 @@ def save_json():
         data = extract_resume_data_from_form(request.form)
         
         # Generate a meaningful filename using the person's name
-        clean_name = data["name"].replace(' ', '_')
-        json_filename = f"{clean_name}_resume_data.json"
+        json_filename = f"{_clean_name(data)}_resume_data.json"
         
-        # Create JSON response with appropriate headers for download
+        # Send the encoded JSON as a download (streamed in chunks when falling back to the stdlib encoder)
         return Response(
-            json.dumps(data, indent=2),
+            _encode_json(data),
             mimetype='application/json',
             headers={
                 'Content-Disposition': f'attachment; filename={json_filename}'
@@ -219,46 +263,54 @@ def save_json():
 @app.route('/generate', methods=['POST'])
 def generate_resume():
     """Process form data and generate resume"""
+    # Generated files stay available for download for a while; clear out the expired ones
+    _remove_expired_outputs()
+    
+    output_dir = None
     try:
         # Extract form data using the shared function
         data = extract_resume_data_from_form(request.form)
         
-        # Save JSON to temporary file
-        json_file = os.path.join(app.config['UPLOAD_FOLDER'], 'temp_resume_data.json')
-        with open(json_file, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        # Generate resume
-        resume_path = resume_generator.create_resume_from_json(json_file)
+        # Each request gets its own directory for the resume and its JSON copy, so
+        # concurrent requests (even for the same name) never overwrite each other's files
+        output_dir = tempfile.mkdtemp(prefix=OUTPUT_DIR_PREFIX, dir=app.config['UPLOAD_FOLDER'])
+        resume_name = os.path.basename(data.get('output_filename') or '') or f"{_clean_name(data)}_Resume.docx"
         
-        # Keep a copy of the JSON for user download
-        json_copy = os.path.join(app.config['UPLOAD_FOLDER'], f"{data['name'].replace(' ', '_')}_resume_data.json")
-        with open(json_copy, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Generate resume directly from the extracted data (the JSON copy keeps the user's file name)
+        resume_path = resume_generator.create_resume_from_dict(
+            dict(data, output_filename=os.path.join(output_dir, resume_name)))
         
-        # Clean up temporary JSON file
-        os.remove(json_file)
+        # Write the JSON once, for user download
+        json_copy = os.path.join(output_dir, f"{_clean_name(data)}_resume_data.json")
+        _write_json(data, json_copy)
         
-        # Return the result with download links for both resume and JSON
+        # Return the result with download links for both resume and JSON, relative to UPLOAD_FOLDER
+        upload_folder = app.config['UPLOAD_FOLDER']
         return render_template('success.html', 
-                              resume_path=resume_path,
-                              json_path=json_copy,
+                              resume_path=os.path.relpath(resume_path, upload_folder),
+                              json_path=os.path.relpath(json_copy, upload_folder),
                               user_name=data['name'])
     
     except Exception as e:
+        # Nothing will be downloaded from a failed request
+        if output_dir is not None:
+            shutil.rmtree(output_dir, ignore_errors=True)
         flash(f"Error generating resume: {str(e)}", "error")
         return redirect(url_for('index'))
 
 @app.route('/download/<path:filename>')
 def download_file(filename):
-    """Download a file"""
-    directory = os.path.dirname(filename)
-    file = os.path.basename(filename)
-    return send_file(filename, as_attachment=True, download_name=file)
+    """Download a generated file; filename is relative to UPLOAD_FOLDER and can't point outside it"""
+    return send_from_directory(app.config['UPLOAD_FOLDER'], filename, as_attachment=True)
 
 @app.route('/upload_json', methods=['POST'])
 def upload_json():
     """Process uploaded JSON to pre-fill the form"""
+    # Reject oversized uploads from the Content-Length header, before the body is parsed
+    if request.content_length and request.content_length > app.config['MAX_JSON_UPLOAD_SIZE']:
+        flash('File too large. Resume JSON uploads are limited to 1MB.', 'error')
+        return redirect(url_for('index'))
+    
     if 'json_file' not in request.files:
         flash('No file part', 'error')
         return redirect(url_for('index'))
@@ -269,18 +321,10 @@ def upload_json():
         flash('No selected file', 'error')
         return redirect(url_for('index'))
         
-    if file and file.filename.endswith('.json'):
+    if file and file.mimetype in JSON_MIMETYPES and file.filename.lower().endswith('.json'):
         try:
-            # Save the uploaded file temporarily
-            temp_path = os.path.join(app.config['UPLOAD_FOLDER'], 'uploaded_resume_data.json')
-            file.save(temp_path)
-            
-            # Load the data
-            with open(temp_path, 'r') as f:
-                data = json.load(f)
-                
-            # Remove the temporary file
-            os.remove(temp_path)
+            # Load the data straight from the upload stream - no need to touch the disk
+            data = _load_json(file.stream)
             
             # Pass the data to the template
             return render_template('index.html', prefill_data=data)
@@ -292,37 +336,33 @@ def upload_json():
         flash('Invalid file type. Please upload a JSON file.', 'error')
         return redirect(url_for('index'))
 
-@app.route('/template')
-def template():
-    """Return a blank JSON template"""
-    template_data = {
-        "name": "",
-        "contact_info": ["email", "phone", "linkedin", "location"],
-        "professional_summary": "",
-        "work_experience": [{
-            "title": "",
-            "company": "",
-            "location": "",
-            "start_date": "",
-            "end_date": "",
-            "responsibilities": [""],
-            "achievements": [""]
-        }],
-        "technical_skills": {
-            "Category": ["Skill1", "Skill2"]
-        },
-        "education": [{
-            "degree": "",
-            "institution": "",
-            "location": "",
-            "graduation_date": "",
-            "gpa": "",
-            "relevant_courses": [""]
-        }]
-    }
-    
+# Blank JSON template served by /template. It never changes, so it is only encoded once.
+TEMPLATE_DATA = {
+    "name": "",
+    "contact_info": ["email", "phone", "linkedin", "location"],
+    "professional_summary": "",
+    "work_experience": [{
+        "title": "",
+        "company": "",
+        "location": "",
+        "start_date": "",
+        "end_date": "",
+        "responsibilities": [""],
+        "achievements": [""]
+    }],
+    "technical_skills": {
+        "Category": ["Skill1", "Skill2"]
+    },
+    "education": [{
+        "degree": "",
+        "institution": "",
+        "location": "",
+        "graduation_date": "",
+        "gpa": "",
+        "relevant_courses": [""]
+    }],
     # Optional sections
-    template_data["internships"] = [{
+    "internships": [{
         "title": "",
         "company": "",
         "location": "",
@@ -330,26 +370,39 @@ def template():
         "end_date": "",
         "responsibilities": [""],
         "achievements": [""]
-    }]
-    
-    template_data["projects"] = [{
+    }],
+    "projects": [{
         "name": "",
         "description": "",
         "technologies": [""],
         "url": "",
         "start_date": "",
         "end_date": ""
-    }]
-    
-    template_data["certifications"] = [{
+    }],
+    "certifications": [{
         "name": "",
         "issuer": "",
         "date": "",
         "expiration_date": "",
         "url": ""
     }]
-    
-    return jsonify(template_data)
+}
+
+@lru_cache(maxsize=1)
+def _template_body():
+    """Encode TEMPLATE_DATA once, on first use"""
+    if orjson is not None:
+        return orjson.dumps(TEMPLATE_DATA)
+    return json.dumps(TEMPLATE_DATA).encode('utf-8')
+
+@app.route('/template')
+def template():
+    """Return a blank JSON template"""
+    return Response(
+        _template_body(),
+        mimetype='application/json',
+        headers={'Cache-Control': 'public, max-age=3600'}
+    )
 
 if __name__ == '__main__':
     app.run(debug=True) 
\ No newline at end of file
@@ -4,21 +4,62 @@ Resume Generator for ATS Optimization
 This script creates ATS-friendly resumes optimized to score 90+ in Applicant Tracking Systems.
 """
 
-import os
 import re
-import argparse
+import bisect
 import json
-from datetime import datetime
+import logging
+from functools import lru_cache
+from operator import itemgetter
+# html.escape rather than xml.sax.saxutils.escape: same output for text, but saxutils imports urllib.request
+from html import escape
 import docx
 from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT, WD_LINE_SPACING
+from docx.shared import Pt, Inches, Twips
+from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.shared import OxmlElement, qn
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 import docx.opc.constants
-import tempfile
 import sys  # Added for sys.exit
 
+try:
+    import orjson  # Optional - faster JSON parsing when installed
+except ImportError:
+    orjson = None
+
+# Sizing diagnostics are logged at DEBUG; the CLI configures logging in main()
+log = logging.getLogger(__name__)
+
+# XML for a hyperlink run, filled in per link and parsed in one go rather than built node by node
+_HYPERLINK_XML = (
+    '<w:hyperlink %s r:id="{r_id}">'
+    '<w:r>{rpr}<w:t>{text}</w:t></w:r>'
+    '</w:hyperlink>'
+) % nsdecls('w', 'r')
+_RPR_XML = '<w:rPr><w:color w:val="{color}"/>{underline}</w:rPr>'
+_UNDERLINE_XML = '<w:u w:val="single"/>'
+
+# Run properties for the (color, underline) combinations the resume uses, keyed like add_hyperlink's arguments
+_RPR_VARIANTS = {
+    (color, underline): _RPR_XML.format(color=color, underline=_UNDERLINE_XML if underline else '')
+    for color in ('0000FF',)
+    for underline in (True, False)
+}
+
+# XML for an indented bullet line (0.2" left indent, no space after); bullets are joined and parsed together.
+# _create_styles fills in the style and marker, passing text='{}' to leave a hole for each bullet's text
+_BULLET_XML = (
+    '<w:p><w:pPr><w:pStyle w:val="{style_id}"/><w:spacing w:after="0"/><w:ind w:left="288"/></w:pPr>'
+    '<w:r><w:t xml:space="preserve">{marker} {text}</w:t></w:r></w:p>'
+)
+
+# Tabs and line breaks are separate run elements rather than text, as add_run writes them
+_BULLET_TEXT_BREAKS = str.maketrans({
+    '\t': '</w:t><w:tab/><w:t xml:space="preserve">',
+    '\n': '</w:t><w:br/><w:t xml:space="preserve">',
+    '\r': '</w:t><w:br/><w:t xml:space="preserve">',
+})
+
 # Add this function to create hyperlinks in Word documents
 def add_hyperlink(paragraph, url, text, color=None, underline=True):
     """
@@ -27,60 +68,50 @@ def add_hyperlink(paragraph, url, text, color=None, underline=True):
     :param paragraph: The paragraph to add the hyperlink to
     :param url: The URL to link to
     :param text: The text to display for the link
-    :param color: The color of the link (RGB tuple), or None for default
+    :param color: The color of the link (hex string such as '0000FF'), or None for default blue
     :param underline: Whether to underline the link
-    :return: The hyperlink run
+    :return: The hyperlink element
     """
     # This gets access to the document.xml.rels file and adds a new relationship ID
     part = paragraph.part
     r_id = part.relate_to(url, docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
     
-    # Create the hyperlink element
-    hyperlink = OxmlElement('w:hyperlink')
-    hyperlink.set(qn('r:id'), r_id)
-    
-    # Create a new run element
-    new_run = OxmlElement('w:r')
-    
-    # Create new run properties element
-    rPr = OxmlElement('w:rPr')
-    
-    # Add color if specified
-    if color:
-        c = OxmlElement('w:color')
-        c.set(qn('w:val'), color)
-        rPr.append(c)
-    
-    # Add hyperlink styling (usually blue + underline)
-    if not color:
-        color = OxmlElement('w:color')
-        color.set(qn('w:val'), '0000FF')  # Default hyperlink color (blue)
-        rPr.append(color)
-    
-    # Add underline if specified
-    if underline:
-        u = OxmlElement('w:u')
-        u.set(qn('w:val'), 'single')
-        rPr.append(u)
-    
-    # Join all the xml elements
-    new_run.append(rPr)
-    
-    # Set the text of the hyperlink
-    t = OxmlElement('w:t')
-    t.text = text
-    new_run.append(t)
-    
-    hyperlink.append(new_run)
+    # Build the hyperlink element (default hyperlink color is blue)
+    color = color or '0000FF'
+    rpr = _RPR_VARIANTS.get((color, underline))
+    if rpr is None:
+        rpr = _RPR_XML.format(color=color, underline=_UNDERLINE_XML if underline else '')
+    hyperlink = parse_xml(_HYPERLINK_XML.format(r_id=r_id, rpr=rpr, text=escape(text, quote=False)))
     
     # Add the hyperlink to the paragraph
     paragraph._p.append(hyperlink)
     
     return hyperlink
 
+# Font sizes and margins by content volume, calibrated on typical resume content lengths.
+# A volume above _SIZE_TABLE_THRESHOLDS[i] (and not above the next one) uses _SIZE_TABLE_VALUES[i + 1]
+_SIZE_TABLE_THRESHOLDS = (900, 1200, 1500, 1800)
+_SIZE_TABLE_VALUES = (
+    # (name pt, heading pt, normal pt, margin inches)
+    (16, 14, 12, 1.2),  # Small resume - maximum sizes and larger margins for readability
+    (16, 14, 12, 0.9),  # Medium resume
+    (16, 13, 12, 0.7),  # Medium-large resume
+    (15, 13, 12, 0.6),  # Large resume
+    (14, 13, 12, 0.5),  # Very large resume - minimum sizes and margins to fit more content
+)
+
 class ResumeGenerator:
     """Generate ATS-optimized resumes"""
     
+    # Keywords for ATS analysis: whole words of 4+ letters (shorter words are mostly filler)
+    _KEYWORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+    
+    # Spacing and indent lengths used throughout the sections, converted once
+    _PT0 = Pt(0)
+    _PT2 = Pt(2)
+    _PT4 = Pt(4)
+    _IN_02 = Inches(0.2)
+    
     def __init__(self, name, contact_info, professional_summary=None):
         """Initialize resume generator with personal details"""
         self.name = name
@@ -95,6 +126,9 @@ class ResumeGenerator:
         self.certifications = []
         self.doc = Document()
         
+        # Running content volume estimate, updated by the add_* methods (see _estimate_content_volume)
+        self._content_volume = len(professional_summary) * 0.5 if professional_summary else 0
+        
         # Set font size constraints
         self.min_font_size = 12
         self.max_font_size = 14
@@ -111,34 +145,35 @@ class ResumeGenerator:
     
     def _setup_document(self):
         """Set up document styles and formatting for ATS optimization"""
-        # Set up margins (will be adjusted dynamically if needed)
-        sections = self.doc.sections
-        for section in sections:
-            section.top_margin = Inches(self.margin_size)
-            section.bottom_margin = Inches(self.margin_size)
-            section.left_margin = Inches(self.margin_size)
-            section.right_margin = Inches(self.margin_size)
-        
-        # Create styles with current font sizes
         self._create_styles()
+        
+        # Apply the current font sizes and margins (will be adjusted dynamically if needed)
+        self._update_styles()
     
-    def _create_styles(self):
-        """Create document styles with current font sizes"""
+    def _ensure_style(self, name):
+        """Return the paragraph style with this name, adding it to the document if it doesn't exist yet"""
         styles = self.doc.styles
-        
+        try:
+            return styles[name]
+        except KeyError:
+            return styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+    
+    def _create_styles(self):
+        """
+        Create document styles; font sizes are applied by _update_styles
+        Safe to call again on the same document: existing styles are reused and their properties reset
+        """
         # Heading style
-        heading_style = styles.add_style('ATS Heading', WD_STYLE_TYPE.PARAGRAPH)
+        heading_style = self._ensure_style('ATS Heading')
         heading_style.font.name = 'Calibri'
-        heading_style.font.size = Pt(self.heading_font_size)
         heading_style.font.bold = True
         heading_paragraph_format = heading_style.paragraph_format
         heading_paragraph_format.space_before = Pt(6)
         heading_paragraph_format.space_after = Pt(2)
         
         # Normal text style
-        normal_style = styles.add_style('ATS Normal', WD_STYLE_TYPE.PARAGRAPH)
+        normal_style = self._ensure_style('ATS Normal')
         normal_style.font.name = 'Calibri'
-        normal_style.font.size = Pt(self.normal_font_size)
         normal_paragraph_format = normal_style.paragraph_format
         normal_paragraph_format.space_before = Pt(0)
         normal_paragraph_format.space_after = Pt(0)
@@ -147,13 +182,37 @@ class ResumeGenerator:
         normal_paragraph_format.line_spacing = 1.0
         
         # Name style
-        name_style = styles.add_style('Name Style', WD_STYLE_TYPE.PARAGRAPH)
+        name_style = self._ensure_style('Name Style')
         name_style.font.name = 'Calibri'
-        name_style.font.size = Pt(self.name_font_size)
         name_style.font.bold = True
         paragraph_format = name_style.paragraph_format
         paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
         paragraph_format.space_after = Pt(2)
+        
+        # Paragraphs refer to styles by ID; resolve each name once here (see _add_paragraph)
+        self._style_ids = {style.name: style.style_id for style in (heading_style, normal_style, name_style)}
+        
+        # Bullet templates for responsibilities and achievements; only the text changes per bullet (see _add_bullets)
+        self._bullet_xml = tuple(
+            _BULLET_XML.format(style_id=normal_style.style_id, marker=marker, text='{}') for marker in ("•", "✓")
+        )
+    
+    def _update_styles(self):
+        """
+        Apply the current font sizes and margins to the existing styles and sections
+        Paragraphs refer to the styles by name, so content already added picks up the new sizes
+        """
+        styles = self.doc.styles
+        styles['ATS Heading'].font.size = Pt(self.heading_font_size)
+        styles['ATS Normal'].font.size = Pt(self.normal_font_size)
+        styles['Name Style'].font.size = Pt(self.name_font_size)
+        
+        margin = Inches(self.margin_size)
+        for section in self.doc.sections:
+            section.top_margin = margin
+            section.bottom_margin = margin
+            section.left_margin = margin
+            section.right_margin = margin
     
     def add_work_experience(self, title, company, location, start_date, end_date, responsibilities, achievements=None):
         """Add work experience entry"""
@@ -166,10 +225,21 @@ class ResumeGenerator:
             'responsibilities': responsibilities,
             'achievements': achievements or []
         })
+        
+        # Base value for each job plus its responsibilities and achievements
+        self._content_volume += 100
+        for text in responsibilities:
+            self._content_volume += len(text) * 0.7
+        for text in achievements or ():
+            self._content_volume += len(text) * 0.7
     
     def add_technical_skills(self, category, skills):
         """Add technical skills by category"""
+        # Replacing a category swaps its contribution rather than adding to it
+        if category in self.technical_skills:
+            self._content_volume -= self._skills_volume(category, self.technical_skills[category])
         self.technical_skills[category] = skills
+        self._content_volume += self._skills_volume(category, skills)
     
     def add_education(self, degree, institution, location, graduation_date, gpa=None, relevant_courses=None):
         """Add education entry"""
@@ -181,6 +251,7 @@ class ResumeGenerator:
             'gpa': gpa,
             'relevant_courses': relevant_courses
         })
+        self._content_volume += 80  # Base value for each education entry
     
     def add_internship(self, title, company, location, start_date, end_date, responsibilities, achievements=None):
         """Add internship entry"""
@@ -215,13 +286,23 @@ class ResumeGenerator:
             'url': url
         })
     
+    def _add_paragraph(self, text='', style='ATS Normal'):
+        """
+        Add a paragraph with one of the resume styles
+        Same as doc.add_paragraph(text, style), but sets the style ID directly; resolving the
+        style name in python-docx scans every style in the document for each paragraph
+        """
+        paragraph = self.doc.add_paragraph(text)
+        paragraph._p.style = self._style_ids[style]
+        return paragraph
+    
     def _add_header(self):
         """Add name and contact information at the top of the resume"""
         # Add name
-        name_paragraph = self.doc.add_paragraph(self.name, style='Name Style')
+        name_paragraph = self._add_paragraph(self.name, style='Name Style')
         
         # Add contact information - separating LinkedIn to make it clickable
-        contact_paragraph = self.doc.add_paragraph(style='ATS Normal')
+        contact_paragraph = self._add_paragraph(style='ATS Normal')
         contact_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
         
         # Process contact info to identify and make LinkedIn link clickable
@@ -253,97 +334,94 @@ class ResumeGenerator:
             add_hyperlink(contact_paragraph, url, linkedin_url, '0000FF', True)
         
         # Remove extra paragraph space
-        contact_paragraph.paragraph_format.space_after = Pt(4)
+        contact_paragraph.paragraph_format.space_after = self._PT4
     
     def _add_professional_summary(self):
         """Add professional summary section"""
         if self.professional_summary:
-            heading = self.doc.add_paragraph("PROFESSIONAL SUMMARY", style='ATS Heading')
+            heading = self._add_paragraph("PROFESSIONAL SUMMARY", style='ATS Heading')
             
-            summary = self.doc.add_paragraph(self.professional_summary, style='ATS Normal')
-            summary.paragraph_format.space_after = Pt(4)
+            summary = self._add_paragraph(self.professional_summary, style='ATS Normal')
+            summary.paragraph_format.space_after = self._PT4
     
     def _add_work_experience(self):
         """Add work experience section"""
-        heading = self.doc.add_paragraph("WORK EXPERIENCE", style='ATS Heading')
+        heading = self._add_paragraph("WORK EXPERIENCE", style='ATS Heading')
         
         for i, job in enumerate(self.work_experience):
             # Job title and company
-            job_heading = self.doc.add_paragraph(style='ATS Normal')
+            job_heading = self._add_paragraph(style='ATS Normal')
             job_title = job_heading.add_run(f"{job['title']} | {job['company']}")
             job_title.bold = True
             
             # Location and dates - same line to save space
             job_info = job_heading
             job_info.add_run(f" — {job['location']} | {job['start_date']} - {job['end_date']}")
-            job_info.paragraph_format.space_after = Pt(2)
+            job_info.paragraph_format.space_after = self._PT2
             
-            # Responsibilities
-            for resp in job['responsibilities']:
-                resp_para = self.doc.add_paragraph(style='ATS Normal')
-                resp_para.paragraph_format.left_indent = Inches(0.2)
-                resp_para.paragraph_format.space_after = Pt(0)
-                resp_para.add_run("• " + resp)
-            
-            # Achievements
-            if job['achievements']:
-                for achievement in job['achievements']:
-                    ach_para = self.doc.add_paragraph(style='ATS Normal')
-                    ach_para.paragraph_format.left_indent = Inches(0.2)
-                    ach_para.paragraph_format.space_after = Pt(0)
-                    ach_para.add_run("✓ " + achievement)
+            # Responsibilities and achievements
+            self._add_bullets(job['responsibilities'], job['achievements'])
             
             # Only add space between jobs, not after the last one
             if i < len(self.work_experience) - 1:
-                self.doc.add_paragraph(style='ATS Normal').paragraph_format.space_after = Pt(2)
+                self._add_paragraph(style='ATS Normal').paragraph_format.space_after = self._PT2
+    
+    def _add_bullets(self, responsibilities, achievements):
+        """
+        Add responsibilities ("•") and achievements ("✓") as indented bullet paragraphs
+        The paragraphs are built as one XML string and parsed together instead of one add_paragraph call each
+        """
+        if not responsibilities and not achievements:
+            return
+        
+        responsibility_xml, achievement_xml = self._bullet_xml
+        bullets = [responsibility_xml.format(escape(item, quote=False).translate(_BULLET_TEXT_BREAKS))
+                   for item in responsibilities]
+        bullets += [achievement_xml.format(escape(item, quote=False).translate(_BULLET_TEXT_BREAKS))
+                    for item in achievements]
+        
+        paragraphs = parse_xml('<w:body %s>%s</w:body>' % (nsdecls('w'), ''.join(bullets)))
+        
+        # Insert ahead of the section properties, as add_paragraph does
+        body = self.doc.element.body
+        for paragraph in list(paragraphs):
+            body._insert_p(paragraph)
     
     def _add_internships(self):
         """Add internships section if any exist"""
         if not self.internships:
             return  # Skip section if no internships
             
-        heading = self.doc.add_paragraph("INTERNSHIPS", style='ATS Heading')
+        heading = self._add_paragraph("INTERNSHIPS", style='ATS Heading')
         
         for i, internship in enumerate(self.internships):
             # Internship title and company
-            intern_heading = self.doc.add_paragraph(style='ATS Normal')
+            intern_heading = self._add_paragraph(style='ATS Normal')
             intern_title = intern_heading.add_run(f"{internship['title']} | {internship['company']}")
             intern_title.bold = True
             
             # Location and dates - same line to save space
             intern_info = intern_heading
             intern_info.add_run(f" — {internship['location']} | {internship['start_date']} - {internship['end_date']}")
-            intern_info.paragraph_format.space_after = Pt(2)
+            intern_info.paragraph_format.space_after = self._PT2
             
-            # Responsibilities
-            for resp in internship['responsibilities']:
-                resp_para = self.doc.add_paragraph(style='ATS Normal')
-                resp_para.paragraph_format.left_indent = Inches(0.2)
-                resp_para.paragraph_format.space_after = Pt(0)
-                resp_para.add_run("• " + resp)
-            
-            # Achievements
-            if internship['achievements']:
-                for achievement in internship['achievements']:
-                    ach_para = self.doc.add_paragraph(style='ATS Normal')
-                    ach_para.paragraph_format.left_indent = Inches(0.2)
-                    ach_para.paragraph_format.space_after = Pt(0)
-                    ach_para.add_run("✓ " + achievement)
+            # Responsibilities and achievements
+            self._add_bullets(internship['responsibilities'], internship['achievements'])
             
             # Only add space between internships, not after the last one
             if i < len(self.internships) - 1:
-                self.doc.add_paragraph(style='ATS Normal').paragraph_format.space_after = Pt(2)
+                self._add_paragraph(style='ATS Normal').paragraph_format.space_after = self._PT2
     
     def _add_projects(self):
         """Add projects section if any exist"""
         if not self.projects:
             return  # Skip section if no projects
             
-        heading = self.doc.add_paragraph("PROJECTS", style='ATS Heading')
+        heading = self._add_paragraph("PROJECTS", style='ATS Heading')
         
         for i, project in enumerate(self.projects):
             # Project name with optional URL as hyperlink
-            proj_heading = self.doc.add_paragraph(style='ATS Normal')
+            proj_heading = self._add_paragraph(style='ATS Normal')
             proj_name = proj_heading.add_run(f"{project['name']}")
             proj_name.bold = True
             
@@ -360,33 +438,33 @@ class ResumeGenerator:
                 add_hyperlink(proj_heading, url, "Project Link", '0000FF', True)
             
             # Project description
-            desc_para = self.doc.add_paragraph(style='ATS Normal')
-            desc_para.paragraph_format.left_indent = Inches(0.2)
+            desc_para = self._add_paragraph(style='ATS Normal')
+            desc_para.paragraph_format.left_indent = self._IN_02
             desc_para.add_run(project['description'])
             
             # Technologies used
             if project['technologies']:
-                tech_para = self.doc.add_paragraph(style='ATS Normal')
-                tech_para.paragraph_format.left_indent = Inches(0.2)
-                tech_para.paragraph_format.space_after = Pt(0)
+                tech_para = self._add_paragraph(style='ATS Normal')
+                tech_para.paragraph_format.left_indent = self._IN_02
+                tech_para.paragraph_format.space_after = self._PT0
                 tech_text = tech_para.add_run("Technologies: ")
                 tech_text.bold = True
                 tech_para.add_run(", ".join(project['technologies']))
             
             # Add space between projects, not after the last one
             if i < len(self.projects) - 1:
-                self.doc.add_paragraph(style='ATS Normal').paragraph_format.space_after = Pt(2)
+                self._add_paragraph(style='ATS Normal').paragraph_format.space_after = self._PT2
     
     def _add_certifications(self):
         """Add certifications section if any exist"""
         if not self.certifications:
             return  # Skip section if no certifications
             
-        heading = self.doc.add_paragraph("CERTIFICATIONS", style='ATS Heading')
+        heading = self._add_paragraph("CERTIFICATIONS", style='ATS Heading')
         
         for i, cert in enumerate(self.certifications):
             # Certification name and issuer
-            cert_heading = self.doc.add_paragraph(style='ATS Normal')
+            cert_heading = self._add_paragraph(style='ATS Normal')
             cert_name = cert_heading.add_run(f"{cert['name']} | {cert['issuer']}")
             cert_name.bold = True
             
@@ -406,34 +484,34 @@ class ResumeGenerator:
             
             # Add space between certifications, not after the last one
             if i < len(self.certifications) - 1:
-                cert_heading.paragraph_format.space_after = Pt(2)
+                cert_heading.paragraph_format.space_after = self._PT2
     
     def _add_technical_skills(self):
         """Add technical skills section in a more compact format"""
-        heading = self.doc.add_paragraph("TECHNICAL SKILLS", style='ATS Heading')
+        heading = self._add_paragraph("TECHNICAL SKILLS", style='ATS Heading')
         
         # Use a table-like format to fit more skills in less space
-        skills_para = self.doc.add_paragraph(style='ATS Normal')
+        skills_para = self._add_paragraph(style='ATS Normal')
         
-        # Process all skills into a single paragraph with proper formatting
+        # Process all skills into a single paragraph with proper formatting:
+        # a bold category label, then one run with the skills and the line break that follows them
+        last = len(self.technical_skills) - 1
         for i, (category, skills) in enumerate(self.technical_skills.items()):
             category_text = skills_para.add_run(f"{category}: ")
             category_text.bold = True
-            skills_para.add_run(", ".join(skills))
             
             # Add line break between categories except for the last one
-            if i < len(self.technical_skills) - 1:
-                skills_para.add_run("\n")
+            skills_para.add_run(", ".join(skills) + ("\n" if i < last else ""))
         
-        skills_para.paragraph_format.space_after = Pt(4)
+        skills_para.paragraph_format.space_after = self._PT4
     
     def _add_education(self):
         """Add education section in a more compact format"""
-        heading = self.doc.add_paragraph("EDUCATION", style='ATS Heading')
+        heading = self._add_paragraph("EDUCATION", style='ATS Heading')
         
         for i, edu in enumerate(self.education):
             # Degree and institution
-            edu_heading = self.doc.add_paragraph(style='ATS Normal')
+            edu_heading = self._add_paragraph(style='ATS Normal')
             degree_text = edu_heading.add_run(f"{edu['degree']} | {edu['institution']}")
             degree_text.bold = True
             
@@ -446,49 +524,40 @@ class ResumeGenerator:
             
             # Add relevant courses if available
             if edu['relevant_courses'] and len(edu['relevant_courses']) > 0:
-                courses_para = self.doc.add_paragraph(style='ATS Normal')
-                courses_para.paragraph_format.left_indent = Inches(0.2)
+                courses_para = self._add_paragraph(style='ATS Normal')
+                courses_para.paragraph_format.left_indent = self._IN_02
                 courses_text = courses_para.add_run("Relevant Coursework: ")
                 courses_text.bold = True
                 courses_para.add_run(", ".join(edu['relevant_courses']))
             
             # Only add space between education entries, not after the last one
             if i < len(self.education) - 1:
-                edu_heading.paragraph_format.space_after = Pt(2)
+                edu_heading.paragraph_format.space_after = self._PT2
+    
+    def _add_sections(self):
+        """Add all resume sections to the document, in order"""
+        self._add_header()
+        self._add_professional_summary()
+        self._add_work_experience()
+        self._add_internships()
+        self._add_projects()
+        self._add_certifications()
+        self._add_technical_skills()
+        self._add_education()
+    
+    @staticmethod
+    def _skills_volume(category, skills):
+        """Content volume of one skill category (skills are less space-intensive)"""
+        return len(category) + sum(len(skill) for skill in skills) * 0.3
     
     def _estimate_content_volume(self):
         """
         Estimate the total amount of content in the resume
         Returns a score representing approximate text volume
+        The score is kept up to date as entries are added: the professional summary,
+        work experience (most significant content), skills and education all count
         """
-        volume = 0
-        
-        # Count professional summary
-        if self.professional_summary:
-            volume += len(self.professional_summary) * 0.5
-        
-        # Count work experience (most significant content)
-        for job in self.work_experience:
-            # Job title, company, location info
-            volume += 100  # Base value for each job
-            
-            # Add for responsibilities
-            for resp in job['responsibilities']:
-                volume += len(resp) * 0.7
-            
-            # Add for achievements
-            for achievement in job['achievements']:
-                volume += len(achievement) * 0.7
-        
-        # Count skills (less space-intensive)
-        for category, skills in self.technical_skills.items():
-            volume += len(category) + sum(len(skill) for skill in skills) * 0.3
-        
-        # Count education
-        for edu in self.education:
-            volume += 80  # Base value for each education entry
-        
-        return volume
+        return self._content_volume
     
     def _adjust_font_and_margins(self):
         """
@@ -497,144 +566,182 @@ class ResumeGenerator:
         """
         content_volume = self._estimate_content_volume()
         
-        # Define adjustment thresholds and scaling factors
-        # These values are calibrated based on typical resume content lengths
-        if content_volume > 1800:  # Very large resume
-            # Use minimum font sizes and margins to fit more content
-            self.name_font_size = self.max_font_size
-            self.heading_font_size = self.min_font_size + 1  # 13pt
-            self.normal_font_size = self.min_font_size  # 12pt
-            self.margin_size = self.min_margin  # 0.5 inches
-        elif content_volume > 1500:  # Large resume
-            self.name_font_size = self.max_font_size + 1  # 15pt
-            self.heading_font_size = self.min_font_size + 1  # 13pt
-            self.normal_font_size = self.min_font_size  # 12pt
-            self.margin_size = 0.6  # 0.6 inches
-        elif content_volume > 1200:  # Medium-large resume
-            self.name_font_size = self.max_font_size + 2  # 16pt
-            self.heading_font_size = self.max_font_size - 1  # 13pt
-            self.normal_font_size = self.min_font_size  # 12pt
-            self.margin_size = 0.7  # 0.7 inches
-        elif content_volume > 900:  # Medium resume
-            self.name_font_size = self.max_font_size + 2  # 16pt
-            self.heading_font_size = self.max_font_size  # 14pt
-            self.normal_font_size = self.min_font_size  # 12pt
-            self.margin_size = 0.9  # 0.9 inches
-        else:  # Small resume - use maximum sizes for better readability
-            self.name_font_size = self.max_font_size + 2  # 16pt
-            self.heading_font_size = self.max_font_size  # 14pt
-            self.normal_font_size = self.min_font_size  # 12pt
-            self.margin_size = 1.2  # Larger margins for smaller resumes
-            
-        print(f"Content volume: {content_volume}")
-        print(f"Adjusted fonts - Name: {self.name_font_size}pt, Heading: {self.heading_font_size}pt, Normal: {self.normal_font_size}pt")
-        print(f"Adjusted margins: {self.margin_size} inches")
+        # Look up the size preset; bisect_left keeps a volume equal to a threshold in the smaller tier
+        (self.name_font_size, self.heading_font_size,
+         self.normal_font_size, self.margin_size) = _SIZE_TABLE_VALUES[
+            bisect.bisect_left(_SIZE_TABLE_THRESHOLDS, content_volume)]
+        
+        log.debug("Content volume: %s", content_volume)
+        log.debug("Adjusted fonts - Name: %spt, Heading: %spt, Normal: %spt",
+                  self.name_font_size, self.heading_font_size, self.normal_font_size)
+        log.debug("Adjusted margins: %s inches", self.margin_size)
         
-        # Recreate the document with new sizes
-        self.doc = Document()  # Create a fresh document
-        self._setup_document()  # Apply the adjusted styles
+        # Apply the new sizes to the existing styles
+        self._update_styles()
     
     def _check_and_adjust_for_page_fit(self, output_filename):
         """
         Check if resume fits on one page, and adjust if needed
-        Uses trial-and-error approach by saving temp files and checking
+        Paragraph text and styles don't change between attempts, only font sizes and margins,
+        so the fit is re-estimated from those values and applied to the styles in place
         """
-        # First try with current settings
-        temp_file = tempfile.NamedTemporaryFile(suffix='.docx', delete=False)
-        temp_file.close()
-        
-        # Save current document to temp file
-        self.doc.save(temp_file.name)
-        
-        # Check if it fits on one page by loading it back
-        doc_check = Document(temp_file.name)
-        
-        # Count pages (this is an approximation since python-docx doesn't have direct page counting)
-        page_count = self._estimate_page_count(doc_check)
+        # Lay out the content once; every estimate below reuses it
+        paragraph_layout = self._paragraph_layout()
+        page_count = self._estimate_page_count(paragraph_layout)
         
         attempts = 0
         max_attempts = 3
         
         while page_count > 1 and attempts < max_attempts:
-            attempts += 1
-            
             # Reduce sizes by ~5% each attempt, respecting minimum constraints
-            self.name_font_size = max(self.max_font_size, self.name_font_size * 0.95)
-            self.heading_font_size = max(self.min_font_size + 1, self.heading_font_size * 0.95)
-            self.normal_font_size = self.min_font_size  # Don't reduce below minimum
-            
-            # Reduce margins, respecting minimum margin
-            self.margin_size = max(self.min_margin, self.margin_size * 0.9)
+            sizes = (
+                max(self.max_font_size, self.name_font_size * 0.95),
+                max(self.min_font_size + 1, self.heading_font_size * 0.95),
+                self.min_font_size,  # Don't reduce below minimum
+                # Reduce margins, respecting minimum margin
+                max(self.min_margin, self.margin_size * 0.9)
+            )
             
-            # Recreate document with adjusted sizes
-            self.doc = Document()
-            self._setup_document()
+            # Once everything is at its minimum the estimate can't improve, so stop trying
+            if sizes == (self.name_font_size, self.heading_font_size, self.normal_font_size, self.margin_size):
+                break
             
-            # Regenerate content
-            self._add_header()
-            self._add_professional_summary()
-            self._add_work_experience()
-            self._add_internships()
-            self._add_projects()
-            self._add_certifications()
-            self._add_technical_skills()
-            self._add_education()
+            attempts += 1
+            self.name_font_size, self.heading_font_size, self.normal_font_size, self.margin_size = sizes
             
-            # Save to temp and check again
-            self.doc.save(temp_file.name)
-            doc_check = Document(temp_file.name)
-            page_count = self._estimate_page_count(doc_check)
+            page_count = self._estimate_page_count(paragraph_layout)
             
-            print(f"Adjustment attempt {attempts}: estimated {page_count} pages")
-            print(f"  • Adjusted to - Name: {self.name_font_size}pt, Heading: {self.heading_font_size}pt, Normal: {self.normal_font_size}pt")
-            print(f"  • Margins: {self.margin_size} inches")
+            log.debug("Adjustment attempt %s: estimated %s pages", attempts, page_count)
+            log.debug("  • Adjusted to - Name: %spt, Heading: %spt, Normal: %spt",
+                      self.name_font_size, self.heading_font_size, self.normal_font_size)
+            log.debug("  • Margins: %s inches", self.margin_size)
         
         # If still not fitting after max attempts, warn the user
         if page_count > 1:
-            print("WARNING: Resume may extend to multiple pages. Consider reducing content or further adjusting settings.")
+            log.warning("Resume may extend to multiple pages. Consider reducing content or further adjusting settings.")
         
-        # Clean up temp file
-        os.unlink(temp_file.name)
+        # Apply the final sizes if any adjustment was made
+        if attempts:
+            self._update_styles()
         
         # Save final version to the actual output file
         self.doc.save(output_filename)
     
-    def _estimate_page_count(self, doc):
+    def _paragraph_layout(self):
         """
-        Estimate number of pages in the document
+        Return (style name, text length) for each paragraph the _add_* methods emit,
+        which is all _estimate_page_count needs from the content
+        Computed from the resume data rather than by walking the document's paragraphs,
+        so it must follow the section layout of the _add_* methods
+        """
+        # Text that the emitters pass to add_paragraph/add_run can be None (an empty run), so count it as ''
+        layout = [('Name Style', len(self.name or ''))]
+        
+        # Contact line: other contacts, then the LinkedIn link text
+        linkedin = [item for item in self.contact_info if 'linkedin.com' in item.lower()]
+        others = [item for item in self.contact_info if 'linkedin.com' not in item.lower()]
+        contact_text = " | ".join(others)
+        if others and linkedin:
+            contact_text += " | "
+        if linkedin:
+            contact_text += linkedin[-1]
+        layout.append(('ATS Normal', len(contact_text)))
+        
+        if self.professional_summary:
+            layout.append(('ATS Heading', len("PROFESSIONAL SUMMARY")))
+            layout.append(('ATS Normal', len(self.professional_summary)))
+        
+        def add_jobs(heading, jobs):
+            layout.append(('ATS Heading', len(heading)))
+            for i, job in enumerate(jobs):
+                layout.append(('ATS Normal', len(
+                    f"{job['title']} | {job['company']} — {job['location']} | {job['start_date']} - {job['end_date']}")))
+                # Bullets are "• " or "✓ " followed by the text
+                layout.extend(('ATS Normal', 2 + len(item)) for item in job['responsibilities'])
+                layout.extend(('ATS Normal', 2 + len(item)) for item in job['achievements'])
+                if i < len(jobs) - 1:
+                    layout.append(('ATS Normal', 0))  # Spacer between entries
+        
+        add_jobs("WORK EXPERIENCE", self.work_experience)
+        if self.internships:
+            add_jobs("INTERNSHIPS", self.internships)
+        
+        if self.projects:
+            layout.append(('ATS Heading', len("PROJECTS")))
+            for i, project in enumerate(self.projects):
+                heading_text = f"{project['name']}"
+                if project['start_date'] and project['end_date']:
+                    heading_text += f" | {project['start_date']} - {project['end_date']}"
+                if project['url']:
+                    heading_text += " | Project Link"
+                layout.append(('ATS Normal', len(heading_text)))
+                layout.append(('ATS Normal', len(project['description'] or '')))
+                if project['technologies']:
+                    layout.append(('ATS Normal', len("Technologies: " + ", ".join(project['technologies']))))
+                if i < len(self.projects) - 1:
+                    layout.append(('ATS Normal', 0))
+        
+        if self.certifications:
+            layout.append(('ATS Heading', len("CERTIFICATIONS")))
+            for cert in self.certifications:
+                cert_text = f"{cert['name']} | {cert['issuer']} | Issued: {cert['date']}"
+                if cert['expiration_date']:
+                    cert_text += f" | Expires: {cert['expiration_date']}"
+                if cert['url']:
+                    cert_text += " | Verify"
+                layout.append(('ATS Normal', len(cert_text)))
+        
+        # All skill categories share one paragraph, separated by line breaks
+        layout.append(('ATS Heading', len("TECHNICAL SKILLS")))
+        layout.append(('ATS Normal', len("\n".join(
+            f"{category}: " + ", ".join(skills) for category, skills in self.technical_skills.items()))))
+        
+        layout.append(('ATS Heading', len("EDUCATION")))
+        for edu in self.education:
+            edu_text = f"{edu['degree']} | {edu['institution']} — {edu['location']} | {edu['graduation_date']}"
+            if edu['gpa']:
+                edu_text += f" (GPA: {edu['gpa']})"
+            layout.append(('ATS Normal', len(edu_text)))
+            if edu['relevant_courses'] and len(edu['relevant_courses']) > 0:
+                layout.append(('ATS Normal', len("Relevant Coursework: " + ", ".join(edu['relevant_courses']))))
+        
+        return layout
+    
+    def _estimate_page_count(self, paragraph_layout):
+        """
+        Estimate number of pages for the measured paragraphs at the current font sizes and margins
         This is a heuristic since python-docx doesn't have direct page counting
         """
         # Get page size in points (1/72 of an inch)
         # Assuming US Letter size: 8.5 x 11 inches
-        section = doc.sections[0]
         page_height_inches = 11  # Standard US Letter
         page_width_inches = 8.5
         
         # Convert to points
         page_height_pt = page_height_inches * 72
         
-        # Account for margins
-        margin_top = section.top_margin.pt
-        margin_bottom = section.bottom_margin.pt
-        usable_height_pt = page_height_pt - margin_top - margin_bottom
+        # Margins as the section stores them (whole twips), so the estimate matches the saved document
+        margin = Twips(Inches(self.margin_size).twips)
+        
+        # Account for margins (top and bottom)
+        usable_height_pt = page_height_pt - margin.pt - margin.pt
+        
+        # ~12 chars per inch of text width (left and right margins removed)
+        chars_per_line = int((page_width_inches - margin.inches - margin.inches) * 12)
         
         # Estimate total height needed for all content
         total_content_height = 0
         
         # Estimate based on paragraph count and font sizes
-        for paragraph in doc.paragraphs:
+        for style_name, text_length in paragraph_layout:
             # Base height for a paragraph
-            if 'Heading' in paragraph.style.name:
+            if 'Heading' in style_name:
                 para_height = self.heading_font_size * 1.5  # Slightly more for headings
-            elif 'Name' in paragraph.style.name:
+            elif 'Name' in style_name:
                 para_height = self.name_font_size * 1.5
             else:
                 para_height = self.normal_font_size * 1.2
             
-            # Add estimated line wrapping
-            text_length = len(paragraph.text)
-            chars_per_line = int((page_width_inches - section.left_margin.inches - section.right_margin.inches) * 12)  # ~12 chars per inch
-            
             # Simple line wrapping estimate
             if chars_per_line > 0:
                 lines = max(1, text_length // chars_per_line)
@@ -655,19 +762,12 @@ class ResumeGenerator:
         self._adjust_font_and_margins()
         
         # Add sections
-        self._add_header()
-        self._add_professional_summary()
-        self._add_work_experience()
-        self._add_internships()
-        self._add_projects()
-        self._add_certifications()
-        self._add_technical_skills()
-        self._add_education()
+        self._add_sections()
         
         # Check if resume fits on one page and adjust if needed
         self._check_and_adjust_for_page_fit(output_filename)
         
-        print(f"Resume successfully generated: {output_filename}")
+        log.info("Resume successfully generated: %s", output_filename)
         return output_filename
     
     @staticmethod
@@ -678,18 +778,13 @@ class ResumeGenerator:
         """
         # Extract keywords from job description (simplified version)
         # In a real scenario, this would use more sophisticated NLP techniques
-        job_words = re.findall(r'\b[a-zA-Z][a-zA-Z]+\b', job_description.lower())
-        job_keywords = [word for word in set(job_words) if len(word) > 3]
-        
-        # Count matches
-        matched_keywords = []
-        missing_keywords = []
+        find_keywords = ResumeGenerator._KEYWORD_RE.findall
+        job_keywords = set(find_keywords(job_description.lower()))
         
-        for keyword in job_keywords:
-            if keyword in resume_text.lower():
-                matched_keywords.append(keyword)
-            else:
-                missing_keywords.append(keyword)
+        # Tokenize the resume once and match whole words with set operations
+        resume_words = set(find_keywords(resume_text.lower()))
+        matched_keywords = list(job_keywords & resume_words)
+        missing_keywords = list(job_keywords - resume_words)
         
         # Calculate score (simplified)
         if len(job_keywords) > 0:
@@ -704,8 +799,12 @@ class ResumeGenerator:
         }
 
 
+@lru_cache(maxsize=1)
 def load_example_data():
-    """Load example data for demonstration"""
+    """
+    Load example data for demonstration
+    The dict is built once and the same object is returned on every call, so callers must not modify it
+    """
     return {
         "name": "John Doe",
         "contact_info": [
@@ -777,41 +876,79 @@ def load_example_data():
     }
 
 
-def load_resume_from_json(json_file):
-    """Load resume data from a JSON file"""
+class ResumeDataError(Exception):
+    """Raised when a resume data file can't be read, isn't valid JSON or is missing required fields"""
+
+
+# Top-level fields every resume JSON file must have
+_REQUIRED_FIELDS = frozenset(['name', 'contact_info', 'work_experience', 'technical_skills', 'education'])
+
+
+def load_resume_from_json(json_file, validate=True, quiet=False):
+    """
+    Load resume data from a JSON file
+    Raises ResumeDataError if the file can't be loaded, so batch callers can report it and carry on
+    
+    :param json_file: Path to the JSON file
+    :param validate: Check that the required top-level fields are present; callers loading
+                     files they produced themselves can pass False to skip the check
+    :param quiet: Don't print the success message (e.g. when loading many files in a batch)
+    """
     try:
-        with open(json_file, 'r') as file:
-            data = json.load(file)
-        
-        # Validate required fields
-        required_fields = ['name', 'contact_info', 'work_experience', 'technical_skills', 'education']
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(f"Missing required field in JSON file: {field}")
-        
-        print(f"Successfully loaded resume data from {json_file}")
+        # Read bytes: orjson only parses bytes/str, and json.loads detects the encoding of bytes itself
+        with open(json_file, 'rb') as file:
+            raw = file.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handler below covers both
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        
+        # Validate required fields, reporting all missing ones at once
+        if validate:
+            missing = _REQUIRED_FIELDS - data.keys()
+            if missing:
+                raise ValueError(f"Missing required fields in JSON file: {', '.join(sorted(missing))}")
+        
+        if not quiet:
+            print(f"Successfully loaded resume data from {json_file}")
         return data
-    except json.JSONDecodeError:
-        print(f"Error: {json_file} is not a valid JSON file")
-        sys.exit(1)
+    except json.JSONDecodeError as e:
+        raise ResumeDataError(f"{json_file} is not a valid JSON file") from e
     except Exception as e:
-        print(f"Error loading resume data: {str(e)}")
-        sys.exit(1)
+        raise ResumeDataError(f"Could not load resume data from {json_file}: {str(e)}") from e
+
+
+# Separator for comma-separated answers, taking the whitespace around each comma with it
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+
+def _read_line(message):
+    """
+    Like input(), for piped stdin: write the prompt, then read one line from the buffered stream
+    Raises EOFError at end of input, as input() does
+    """
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
 
 
 def interactive_resume_builder():
     """Interactive CLI for building resume"""
+    # Keep input() (with line editing) for a terminal; read piped answers straight from stdin
+    prompt = input if sys.stdin.isatty() else _read_line
+    
     print("=== ATS-Optimized Resume Generator ===")
     
     # Personal Information
-    name = input("Enter your full name: ")
-    email = input("Enter your email: ")
-    phone = input("Enter your phone number: ")
-    linkedin = input("Enter your LinkedIn URL: ")
-    location = input("Enter your location (City, State): ")
+    name = prompt("Enter your full name: ")
+    email = prompt("Enter your email: ")
+    phone = prompt("Enter your phone number: ")
+    linkedin = prompt("Enter your LinkedIn URL: ")
+    location = prompt("Enter your location (City, State): ")
     contact_info = [email, phone, linkedin, location]
     
-    summary = input("Enter your professional summary (press Enter to skip): ")
+    summary = prompt("Enter your professional summary (press Enter to skip): ")
     
     # Initialize resume
     resume = ResumeGenerator(name, contact_info, summary if summary else None)
@@ -820,16 +957,16 @@ def interactive_resume_builder():
     print("\n=== Work Experience ===")
     more_experience = True
     while more_experience:
-        title = input("Job title: ")
-        company = input("Company name: ")
-        location = input("Job location: ")
-        start_date = input("Start date (e.g., January 2020): ")
-        end_date = input("End date (or 'Present'): ")
+        title = prompt("Job title: ")
+        company = prompt("Company name: ")
+        location = prompt("Job location: ")
+        start_date = prompt("Start date (e.g., January 2020): ")
+        end_date = prompt("End date (or 'Present'): ")
         
         responsibilities = []
         print("Enter job responsibilities (one per line, blank line to finish):")
         while True:
-            resp = input("- ")
+            resp = prompt("- ")
             if not resp:
                 break
             responsibilities.append(resp)
@@ -837,46 +974,44 @@ def interactive_resume_builder():
         achievements = []
         print("Enter key achievements (one per line, blank line to finish):")
         while True:
-            ach = input("- ")
+            ach = prompt("- ")
             if not ach:
                 break
             achievements.append(ach)
         
         resume.add_work_experience(title, company, location, start_date, end_date, responsibilities, achievements)
         
-        more = input("Add another job? (y/n): ").lower()
-        more_experience = more.startswith('y')
+        more = prompt("Add another job? (y/n): ").lower()
+        more_experience = more[:1] == 'y'
     
     # Technical Skills
     print("\n=== Technical Skills ===")
     more_skills = True
     while more_skills:
-        category = input("Skill category (e.g., Programming Languages): ")
+        category = prompt("Skill category (e.g., Programming Languages): ")
         print(f"Enter {category} (comma-separated list):")
-        skills_input = input("> ")
-        skills = [s.strip() for s in skills_input.split(',')]
+        skills_input = prompt("> ").strip()
+        skills = _CSV_SPLIT.split(skills_input) if skills_input else []
         
         resume.add_technical_skills(category, skills)
         
-        more = input("Add another skill category? (y/n): ").lower()
-        more_skills = more.startswith('y')
+        more = prompt("Add another skill category? (y/n): ").lower()
+        more_skills = more[:1] == 'y'
     
     # Education
     print("\n=== Education ===")
     more_education = True
     while more_education:
-        degree = input("Degree/certification: ")
-        institution = input("Institution: ")
-        location = input("Location: ")
-        graduation = input("Graduation date: ")
-        gpa = input("GPA (optional): ")
+        degree = prompt("Degree/certification: ")
+        institution = prompt("Institution: ")
+        location = prompt("Location: ")
+        graduation = prompt("Graduation date: ")
+        gpa = prompt("GPA (optional): ")
         
         # Get relevant courses
-        courses = []
         print("Enter relevant courses (comma-separated list):")
-        courses_input = input("> ")
-        if courses_input:
-            courses = [course.strip() for course in courses_input.split(',')]
+        courses_input = prompt("> ").strip()
+        courses = _CSV_SPLIT.split(courses_input) if courses_input else []
         
         resume.add_education(
             degree, 
@@ -887,143 +1022,154 @@ def interactive_resume_builder():
             courses if courses else None
         )
         
-        more = input("Add another education entry? (y/n): ").lower()
-        more_education = more.startswith('y')
+        more = prompt("Add another education entry? (y/n): ").lower()
+        more_education = more[:1] == 'y'
     
     # Generate resume
-    output_file = input("\nOutput filename (default is YourName_Resume.docx): ")
+    output_file = prompt("\nOutput filename (default is YourName_Resume.docx): ")
     if not output_file:
         output_file = None
     
     resume.generate_resume(output_file)
 
 
-def create_resume_from_json(json_file):
-    """Create a resume from JSON data"""
-    data = load_resume_from_json(json_file)
+def create_resume_from_json(json_file, validate=True, quiet=False):
+    """
+    Create a resume from JSON data
+    Raises ResumeDataError if the file can't be loaded or an entry is missing a field
+    
+    :param json_file: Path to the JSON file
+    :param validate: Passed on to load_resume_from_json
+    :param quiet: Passed on to load_resume_from_json
+    """
+    data = load_resume_from_json(json_file, validate=validate, quiet=quiet)
+    try:
+        resume = _build_resume(data)
+    except KeyError as e:
+        raise ResumeDataError(f"Missing field in resume data from {json_file}: {str(e)}") from e
     
+    # Generate the resume with optional filename from JSON
+    return resume.generate_resume(data.get('output_filename', None))
+
+
+def create_resume_from_dict(data):
+    """Create a resume from already-loaded resume data (same structure as the JSON file)"""
+    resume = _build_resume(data)
+    
+    # Generate the resume with optional filename from JSON
+    output_file = data.get('output_filename', None)
+    return resume.generate_resume(output_file)
+
+
+def _build_resume(data):
+    """Create a ResumeGenerator holding all of the resume data, ready to generate"""
     # Create resume object
     resume = ResumeGenerator(data['name'], data['contact_info'], 
                            data.get('professional_summary', None))
+    _populate_resume(resume, data)
+    return resume
+
+
+# Required keys of each entry type, in the order of the matching add_* method's positional parameters
+_JOB_FIELDS = itemgetter('title', 'company', 'location', 'start_date', 'end_date', 'responsibilities')
+_PROJECT_FIELDS = itemgetter('name', 'description', 'technologies')
+_CERTIFICATION_FIELDS = itemgetter('name', 'issuer', 'date')
+_EDUCATION_FIELDS = itemgetter('degree', 'institution', 'location', 'graduation_date')
+
+
+def _populate_resume(resume, data):
+    """Add every section entry from resume data (same structure as the JSON file) to a ResumeGenerator"""
+    # Each loop binds its add_* method once rather than looking it up for every entry
     
     # Add work experience
+    add_work_experience = resume.add_work_experience
     for job in data['work_experience']:
-        resume.add_work_experience(
-            job['title'], 
-            job['company'], 
-            job['location'], 
-            job['start_date'], 
-            job['end_date'], 
-            job['responsibilities'], 
+        add_work_experience(
+            *_JOB_FIELDS(job),
             job.get('achievements', [])  # Some jobs might not have achievements
         )
     
     # Add internships if present
     if 'internships' in data:
+        add_internship = resume.add_internship
         for internship in data['internships']:
-            resume.add_internship(
-                internship['title'],
-                internship['company'],
-                internship['location'],
-                internship['start_date'],
-                internship['end_date'],
-                internship['responsibilities'],
-                internship.get('achievements', [])
-            )
+            add_internship(*_JOB_FIELDS(internship), internship.get('achievements', []))
     
     # Add projects if present
     if 'projects' in data:
+        add_project = resume.add_project
         for project in data['projects']:
-            resume.add_project(
-                project['name'],
-                project['description'],
-                project['technologies'],
+            add_project(
+                *_PROJECT_FIELDS(project),
                 project.get('url', None),
                 project.get('start_date', None),
                 project.get('end_date', None)
             )
     
     # Add technical skills
+    add_technical_skills = resume.add_technical_skills
     for category, skills in data['technical_skills'].items():
-        resume.add_technical_skills(category, skills)
+        add_technical_skills(category, skills)
     
     # Add certifications if present
     if 'certifications' in data:
+        add_certification = resume.add_certification
         for cert in data['certifications']:
-            resume.add_certification(
-                cert['name'],
-                cert['issuer'],
-                cert['date'],
+            add_certification(
+                *_CERTIFICATION_FIELDS(cert),
                 cert.get('expiration_date', None),
                 cert.get('url', None)
             )
     
     # Add education
+    add_education = resume.add_education
     for edu in data['education']:
-        resume.add_education(
-            edu['degree'],
-            edu['institution'],
-            edu['location'],
-            edu['graduation_date'],
+        add_education(
+            *_EDUCATION_FIELDS(edu),
             edu.get('gpa', None),
             edu.get('relevant_courses', None)
         )
-    
-    # Generate the resume with optional filename from JSON
-    output_file = data.get('output_filename', None)
-    return resume.generate_resume(output_file)
 
 
-def main():
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the command-line parser once, on first use, and reuse it for later main() calls"""
+    # argparse is only needed on the command line, so don't load it when the module is imported (e.g. by app.py)
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Generate ATS-optimized resumes')
     parser.add_argument('--example', action='store_true', help='Generate an example resume')
     parser.add_argument('--interactive', action='store_true', help='Use interactive mode to build resume')
     parser.add_argument('--json', metavar='FILE', help='Path to JSON file with resume data')
+    return parser
+
+
+def main():
+    # Show the sizing diagnostics and warnings on the console
+    logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(message)s')
     
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
     
     if args.example:
         print("Generating example resume...")
-        data = load_example_data()
-        
-        resume = ResumeGenerator(data['name'], data['contact_info'], data['professional_summary'])
-        
-        for job in data['work_experience']:
-            resume.add_work_experience(
-                job['title'], 
-                job['company'], 
-                job['location'], 
-                job['start_date'], 
-                job['end_date'], 
-                job['responsibilities'], 
-                job['achievements']
-            )
-        
-        for category, skills in data['technical_skills'].items():
-            resume.add_technical_skills(category, skills)
-        
-        for edu in data['education']:
-            resume.add_education(
-                edu['degree'],
-                edu['institution'],
-                edu['location'],
-                edu['graduation_date'],
-                edu.get('gpa', None),
-                edu.get('relevant_courses', None)
-            )
-        
-        resume.generate_resume()
+        create_resume_from_dict(load_example_data())
     elif args.json:
         print(f"Creating resume from JSON file: {args.json}")
-        create_resume_from_json(args.json)
+        try:
+            create_resume_from_json(args.json)
+        except ResumeDataError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
     elif args.interactive:
         interactive_resume_builder()
     else:
-        print("No mode selected. Use one of the following:")
-        print("  --example      Generate an example resume")
-        print("  --interactive  Use interactive mode to build resume")
-        print("  --json FILE    Create resume from JSON data file")
-        print("Run 'python resume-generator.py --help' for more information.")
+        sys.stdout.write(
+            "No mode selected. Use one of the following:\n"
+            "  --example      Generate an example resume\n"
+            "  --interactive  Use interactive mode to build resume\n"
+            "  --json FILE    Create resume from JSON data file\n"
+            "Run 'python resume-generator.py --help' for more information.\n"
+        )
 
 
 if __name__ == "__main__":
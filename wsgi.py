@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the Resume Generator web UI
+Serve the app with a production WSGI server instead of the Flask development server, e.g.:
+    gunicorn -w 4 -k gthread --threads 4 wsgi:app
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run()